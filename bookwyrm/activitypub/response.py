@@ -1,27 +1,26 @@
 """ ActivityPub-specific json response wrapper """
-from django.http import JsonResponse
+from django.http import HttpResponse
+import orjson
 
-from .base_activity import ActivityEncoder
 
+def serialize_default(obj):
+    """used by orjson for objects it doesn't know how to serialize"""
+    return obj.__dict__
 
-class ActivitypubResponse(JsonResponse):
+
+class ActivitypubResponse(HttpResponse):
     """
     A class to be used in any place that's serializing responses for
-    Activitypub enabled clients. Uses JsonResponse under the hood, but already
-    configures some stuff beforehand. Made to be a drop-in replacement of
-    JsonResponse.
+    Activitypub enabled clients. Serializes the data with orjson and sets the
+    activitypub content type, so it can be used in place of a JsonResponse.
     """
 
-    def __init__(
-        self,
-        data,
-        encoder=ActivityEncoder,
-        safe=False,
-        json_dumps_params=None,
-        **kwargs
-    ):
+    def __init__(self, data, **kwargs):
 
         if "content_type" not in kwargs:
             kwargs["content_type"] = "application/activity+json"
 
-        super().__init__(data, encoder, safe, json_dumps_params, **kwargs)
+        content = orjson.dumps(
+            data, default=serialize_default, option=orjson.OPT_NON_STR_KEYS
+        )
+        super().__init__(content=content, **kwargs)
@@ -1,5 +1,6 @@
 """ functionality outline for a book data connector """
 from abc import ABC, abstractmethod
+from http.cookiejar import DefaultCookiePolicy
 import imghdr
 import logging
 import re
@@ -7,6 +8,7 @@ import re
 from django.core.files.base import ContentFile
 from django.db import transaction
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from bookwyrm import activitypub, models, settings
@@ -16,6 +18,14 @@ from .format_mappings import format_mappings
 
 logger = logging.getLogger(__name__)
 
+# re-use connections to remote servers across requests for their data, but
+# don't keep cookies from one remote server's response around for the next.
+# failed requests aren't retried, so a stalled server holds up the caller
+# (like the inbox, when it loads a signing key) for one timeout at most
+session = requests.Session()
+session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+session.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=128))
+
 
 class AbstractMinimalConnector(ABC):
     """just the bare bones, for other bookwyrm instances"""
@@ -226,7 +236,7 @@ def get_data(url, params=None, timeout=10):
     raise_not_valid_url(url)
 
     try:
-        resp = requests.get(
+        resp = session.get(
             url,
             params=params,
             headers={  # pylint: disable=line-too-long
@@ -242,7 +252,7 @@ def get_data(url, params=None, timeout=10):
         raise ConnectorException(err)
 
     if not resp.ok:
-        raise ConnectorException()
+        raise ConnectorException(response=resp)
     try:
         data = resp.json()
     except ValueError as err:
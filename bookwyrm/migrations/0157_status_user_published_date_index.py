@@ -0,0 +1,19 @@
+# Generated by Django 3.2.15 on 2022-08-10 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookwyrm", "0156_alter_user_preferred_language"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="status",
+            index=models.Index(
+                fields=["user", "-published_date"], name="bookwyrm_st_user_pub_idx"
+            ),
+        ),
+    ]
@@ -548,21 +548,33 @@ def to_ordered_collection_page(
     queryset, remote_id, id_only=False, page=1, pure=False, **kwargs
 ):
     """serialize and pagiante a queryset"""
-    paginated = Paginator(queryset, PAGE_LENGTH)
+    try:
+        page_number = max(int(page), 1)
+    except (TypeError, ValueError):
+        page_number = 1
+
+    # fetch one extra item to find out if there's a next page, rather than
+    # running a separate count query
+    start = (page_number - 1) * PAGE_LENGTH
+    if id_only:
+        # only the remote ids are needed, so don't load whole objects
+        queryset = queryset.values_list("remote_id", flat=True)
+    object_list = list(queryset[start : start + PAGE_LENGTH + 1])
+    has_next = len(object_list) > PAGE_LENGTH
+    object_list = object_list[:PAGE_LENGTH]
 
-    activity_page = paginated.get_page(page)
     if id_only:
-        items = [s.remote_id for s in activity_page.object_list]
+        items = object_list
     else:
-        items = [s.to_activity(pure=pure) for s in activity_page.object_list]
+        items = [s.to_activity(pure=pure) for s in object_list]
 
     prev_page = next_page = None
-    if activity_page.has_next():
-        next_page = f"{remote_id}?page={activity_page.next_page_number()}"
-    if activity_page.has_previous():
-        prev_page = f"{remote_id}?page=%d{activity_page.previous_page_number()}"
+    if has_next:
+        next_page = f"{remote_id}?page={page_number + 1}"
+    if page_number > 1:
+        prev_page = f"{remote_id}?page={page_number - 1}"
     return activitypub.OrderedCollectionPage(
-        id=f"{remote_id}?page={page}",
+        id=f"{remote_id}?page={page_number}",
         partOf=remote_id,
         orderedItems=items,
         next=next_page,
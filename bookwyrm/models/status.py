@@ -73,6 +73,12 @@ class Status(OrderedCollectionPageMixin, BookWyrmModel):
         """default sorting"""
 
         ordering = ("-published_date",)
+        # a user's statuses are listed newest first in their outbox and profile
+        indexes = (
+            models.Index(
+                fields=["user", "-published_date"], name="bookwyrm_st_user_pub_idx"
+            ),
+        )
 
     def save(self, *args, **kwargs):
         """save and notify"""
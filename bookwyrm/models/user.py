@@ -416,7 +416,7 @@ class KeyPair(ActivitypubMixin, BookWyrmModel):
             del kwargs["broadcast"]
         if not self.public_key:
             self.private_key, self.public_key = create_key_pair()
-        return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
 
 
 @app.task(queue="low_priority")
@@ -1,16 +1,24 @@
 """ signs activitypub activities """
 import hashlib
+import re
 from urllib.parse import urlparse
 import datetime
 from base64 import b64encode, b64decode
+from functools import lru_cache
 
 from Crypto import Random
 from Crypto.PublicKey import RSA
 from Crypto.Signature import pkcs1_15  # pylint: disable=no-name-in-module
 from Crypto.Hash import SHA256
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 MAX_SIGNATURE_AGE = 300
 
+# key="value" pairs in a Signature header; values may contain commas
+SIGNATURE_PARAMS = re.compile(r'(\w+)="([^"]*)"')
+
 
 def create_key_pair():
     """a new public/private key pair, used for creating new users"""
@@ -22,6 +30,18 @@ def create_key_pair():
     return private_key, public_key
 
 
+@lru_cache(maxsize=1024)
+def import_public_key(public_key):
+    """parse a pem-encoded public key, re-using keys we've seen before"""
+    try:
+        key = serialization.load_pem_public_key(public_key.encode("utf8"))
+    except (TypeError, UnsupportedAlgorithm) as err:
+        raise ValueError("Invalid public key") from err
+    if not isinstance(key, rsa.RSAPublicKey):
+        raise ValueError("Public key is not an RSA key")
+    return key
+
+
 def make_signature(sender, destination, date, digest):
     """uses a private key to sign an outgoing message"""
     inbox_parts = urlparse(destination)
@@ -77,11 +97,7 @@ class Signature:
     @classmethod
     def parse(cls, request):
         """extract and parse a signature from an http request"""
-        signature_dict = {}
-        for pair in request.headers["Signature"].split(","):
-            k, v = pair.split("=", 1)
-            v = v.replace('"', "")
-            signature_dict[k] = v
+        signature_dict = dict(SIGNATURE_PARAMS.findall(request.headers["Signature"]))
 
         try:
             key_id = signature_dict["keyId"]
@@ -96,26 +112,32 @@ class Signature:
         """verify rsa signature"""
         if http_date_age(request.headers["date"]) > MAX_SIGNATURE_AGE:
             raise ValueError(f"Request too old: {request.headers['date']}")
-        public_key = RSA.import_key(public_key)
+        public_key = import_public_key(public_key)
 
-        comparison_string = []
+        # build the signed message as bytes directly; header values come to us
+        # latin-1 decoded from WSGI, so this recovers the bytes that were sent
+        comparison = []
         for signed_header_name in self.headers.split(" "):
             if signed_header_name == "(request-target)":
-                comparison_string.append(f"(request-target): post {request.path}")
+                comparison.append(b"(request-target): post " + request.path.encode())
             else:
                 if signed_header_name == "digest":
                     verify_digest(request)
-                comparison_string.append(
-                    f"{signed_header_name}: {request.headers[signed_header_name]}"
+                comparison.append(
+                    signed_header_name.encode("latin-1")
+                    + b": "
+                    + request.headers[signed_header_name].encode("latin-1")
                 )
-        comparison_string = "\n".join(comparison_string)
 
-        signer = pkcs1_15.new(public_key)
-        digest = SHA256.new()
-        digest.update(comparison_string.encode())
-
-        # raises a ValueError if it fails
-        signer.verify(digest, self.signature)
+        try:
+            public_key.verify(
+                self.signature,
+                b"\n".join(comparison),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
+        except InvalidSignature:
+            raise ValueError("Invalid signature")
 
 
 def http_date_age(datestr):
@@ -0,0 +1,26 @@
+"""test activitypub json responses"""
+import json
+
+from django.test import TestCase
+
+from bookwyrm.activitypub import ActivitypubResponse, Mention
+
+
+class Response(TestCase):
+    """serialize responses for activitypub clients"""
+
+    def test_content_type(self):
+        """responses are marked as activitypub json"""
+        result = ActivitypubResponse({"id": "https://example.com/user/mouse"})
+        self.assertEqual(result["Content-Type"], "application/activity+json")
+        self.assertEqual(
+            json.loads(result.content), {"id": "https://example.com/user/mouse"}
+        )
+
+    def test_serialize_objects(self):
+        """nested activity objects are serialized"""
+        mention = Mention(href="https://example.com/user/mouse", name="@mouse")
+        result = ActivitypubResponse({"tag": [mention]})
+        data = json.loads(result.content)
+        self.assertEqual(data["tag"][0]["href"], "https://example.com/user/mouse")
+        self.assertEqual(data["tag"][0]["type"], "Mention")
@@ -159,6 +159,24 @@ class AbstractConnector(TestCase):
         self.assertEqual(author.name, "Test")
         self.assertEqual(author.isni, "hi")
 
+    @responses.activate
+    def test_get_data(self):
+        """load json data through the shared session, without keeping cookies"""
+        responses.add(
+            responses.GET,
+            "https://example.com/user/mouse",
+            json={"id": "https://example.com/user/mouse"},
+            headers={"Set-Cookie": "tracker=abc; Path=/"},
+        )
+        with patch(
+            "bookwyrm.connectors.abstract_connector.session.get",
+            wraps=abstract_connector.session.get,
+        ) as session_get:
+            result = get_data("https://example.com/user/mouse")
+        self.assertEqual(result, {"id": "https://example.com/user/mouse"})
+        self.assertEqual(session_get.call_count, 1)
+        self.assertEqual(len(abstract_connector.session.cookies), 0)
+
     def test_get_data_invalid_url(self):
         """load json data from an arbitrary url"""
         with self.assertRaises(ConnectorException):
@@ -382,6 +382,7 @@ class ActivitypubMixins(TestCase):
         self.assertEqual(page_1.partOf, "http://fish.com/")
         self.assertEqual(page_1.id, "http://fish.com/?page=1")
         self.assertEqual(page_1.next, "http://fish.com/?page=2")
+        self.assertIsNone(page_1.prev)
         self.assertEqual(page_1.orderedItems[0]["content"], "test status 29")
         self.assertEqual(page_1.orderedItems[1]["content"], "test status 28")
 
@@ -392,6 +393,21 @@ class ActivitypubMixins(TestCase):
         self.assertEqual(page_2.id, "http://fish.com/?page=2")
         self.assertEqual(page_2.orderedItems[0]["content"], "test status 14")
         self.assertEqual(page_2.orderedItems[-1]["content"], "test status 0")
+        self.assertIsNone(page_2.next)
+        self.assertEqual(page_2.prev, "http://fish.com/?page=1")
+
+        invalid_page = to_ordered_collection_page(
+            models.Status.objects.all(), "http://fish.com/", page="abc"
+        )
+        self.assertEqual(invalid_page.id, "http://fish.com/?page=1")
+
+        id_page = to_ordered_collection_page(
+            models.Status.objects.all(), "http://fish.com/", id_only=True
+        )
+        self.assertEqual(len(id_page.orderedItems), PAGE_LENGTH)
+        self.assertEqual(
+            id_page.orderedItems[0], models.Status.objects.first().remote_id
+        )
 
     def test_to_ordered_collection(self, *_):
         """convert a queryset into an ordered collection object"""
@@ -7,16 +7,25 @@ from unittest.mock import patch
 
 import json
 import responses
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 
 import pytest
 
 from django.test import TestCase, Client
+from django.test.client import RequestFactory
 from django.utils.http import http_date
 
 from bookwyrm import models
 from bookwyrm.activitypub import Follow
 from bookwyrm.settings import DOMAIN
-from bookwyrm.signatures import create_key_pair, make_signature, make_digest
+from bookwyrm.signatures import (
+    Signature as SignatureParser,
+    create_key_pair,
+    import_public_key,
+    make_signature,
+    make_digest,
+)
 
 
 def get_follow_activity(follower, followee):
@@ -93,7 +102,7 @@ class Signature(TestCase):
     def test_correct_signature(self):
         """this one should just work"""
         response = self.send_test_request(sender=self.mouse)
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
 
     def test_wrong_signature(self):
         """Messages must be signed by the right actor.
@@ -122,7 +131,7 @@ class Signature(TestCase):
 
         with patch("bookwyrm.models.user.get_remote_reviews.delay"):
             response = self.send_test_request(sender=self.fake_remote)
-            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.status_code, 202)
 
     @responses.activate
     def test_key_needs_refresh(self):
@@ -146,20 +155,54 @@ class Signature(TestCase):
         with patch("bookwyrm.models.user.get_remote_reviews.delay"):
             # Key correct:
             response = self.send_test_request(sender=self.fake_remote)
-            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.status_code, 202)
 
             # Old key is cached, so still works:
             response = self.send_test_request(sender=self.fake_remote)
-            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.status_code, 202)
 
             # Try with new key:
             response = self.send_test_request(sender=new_sender)
-            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.status_code, 202)
 
             # Now the old key will fail:
             response = self.send_test_request(sender=self.fake_remote)
             self.assertEqual(response.status_code, 401)
 
+    def test_import_public_key(self):
+        """parsed keys are re-used for the same pem"""
+        public_key = self.fake_remote.key_pair.public_key
+        key = import_public_key(public_key)
+        self.assertIs(import_public_key(public_key), key)
+        self.assertEqual(key.key_size, 1024)
+
+    def test_import_public_key_not_rsa(self):
+        """signatures are only checked with rsa keys"""
+        public_key = (
+            ec.generate_private_key(ec.SECP256R1())
+            .public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode("utf8")
+        )
+        with self.assertRaises(ValueError):
+            import_public_key(public_key)
+
+    def test_parse_signature_header(self):
+        """quoted values can contain commas and equals signs"""
+        request = RequestFactory().post(
+            "",
+            HTTP_SIGNATURE='keyId="https://example.com/user/a,b#main-key",'
+            'algorithm="rsa-sha256",headers="(request-target) host date",'
+            'signature="aGk="',
+        )
+        signature = SignatureParser.parse(request)
+        self.assertEqual(signature.key_id, "https://example.com/user/a,b#main-key")
+        self.assertEqual(signature.headers, "(request-target) host date")
+        self.assertEqual(signature.signature, b"hi")
+
     @responses.activate
     def test_nonexistent_signer(self):
         """fail when unable to look up signer"""
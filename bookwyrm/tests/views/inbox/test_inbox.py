@@ -7,9 +7,16 @@ from django.core.exceptions import PermissionDenied
 from django.http import HttpResponseNotAllowed, HttpResponseNotFound
 from django.test import TestCase, Client
 from django.test.client import RequestFactory
+import responses
 
 from bookwyrm import models, views
 
+# well-formed enough to get past the signature header check
+SIGNATURE = (
+    'keyId="https://example.com/users/rat#main-key",algorithm="rsa-sha256",'
+    'headers="(request-target) host date digest",signature="aGk="'
+)
+
 
 # pylint: disable=too-many-public-methods
 class Inbox(TestCase):
@@ -74,8 +81,90 @@ class Inbox(TestCase):
                 "/user/mouse/inbox",
                 '{"type": "Announce", "object": "exists"}',
                 content_type="application/json",
+                HTTP_SIGNATURE=SIGNATURE,
             )
             self.assertEqual(result.status_code, 401)
+            self.assertTrue(mock_valid.called)
+
+    def test_inbox_unsigned(self):
+        """don't bother parsing the body of an unsigned request"""
+        with patch("bookwyrm.views.inbox.has_valid_signature") as mock_valid:
+            result = self.client.post(
+                "/user/mouse/inbox",
+                "not even json",
+                content_type="application/json",
+            )
+        self.assertEqual(result.status_code, 401)
+        self.assertFalse(mock_valid.called)
+
+    def test_inbox_bad_signature_not_parsed(self):
+        """a signature that doesn't verify is rejected before parsing the body"""
+        with patch("bookwyrm.views.inbox.has_valid_signature") as mock_valid:
+            mock_valid.return_value = False
+            result = self.client.post(
+                "/user/mouse/inbox",
+                "not even json",
+                content_type="application/json",
+                HTTP_SIGNATURE=SIGNATURE,
+            )
+        self.assertEqual(result.status_code, 401)
+
+    @responses.activate
+    def test_inbox_missing_actor_cached(self):
+        """don't look up a signing actor that is gone for every delivery"""
+        responses.add(responses.GET, "https://example.com/users/squirrel", status=410)
+        cached = {}
+        with patch("bookwyrm.views.inbox.cache") as cache_mock:
+            cache_mock.get.side_effect = cached.get
+            cache_mock.set.side_effect = lambda key, value, **_: cached.update(
+                {key: value}
+            )
+            for _ in range(2):
+                result = self.client.post(
+                    "/inbox",
+                    '{"type": "Announce", "object": "exists"}',
+                    content_type="application/json",
+                    HTTP_SIGNATURE=SIGNATURE.replace("rat", "squirrel"),
+                )
+                self.assertEqual(result.status_code, 401)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_inbox_unavailable_actor_not_cached(self):
+        """a server error may be temporary, so the actor is looked up again"""
+        responses.add(responses.GET, "https://example.com/users/squirrel", status=503)
+        cached = {}
+        with patch("bookwyrm.views.inbox.cache") as cache_mock:
+            cache_mock.get.side_effect = cached.get
+            cache_mock.set.side_effect = lambda key, value, **_: cached.update(
+                {key: value}
+            )
+            for _ in range(2):
+                result = self.client.post(
+                    "/inbox",
+                    '{"type": "Announce", "object": "exists"}',
+                    content_type="application/json",
+                    HTTP_SIGNATURE=SIGNATURE.replace("rat", "squirrel"),
+                )
+                self.assertEqual(result.status_code, 401)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(cached, {})
+
+    def test_inbox_wrong_actor(self):
+        """the signature must be from the actor of the activity"""
+        activity = self.create_json
+        activity["object"] = "https://example.com/status/1"
+        with patch("bookwyrm.views.inbox.has_valid_signature") as mock_valid:
+            mock_valid.return_value = True
+            with patch("bookwyrm.views.inbox.activity_task.delay") as mock_task:
+                result = self.client.post(
+                    "/inbox",
+                    json.dumps(activity),
+                    content_type="application/json",
+                    HTTP_SIGNATURE=SIGNATURE,
+                )
+        self.assertEqual(result.status_code, 401)
+        self.assertFalse(mock_task.called)
 
     def test_inbox_invalid_bad_signature_delete(self):
         """invalid signature for Delete is okay though"""
@@ -85,8 +174,9 @@ class Inbox(TestCase):
                 "/user/mouse/inbox",
                 '{"type": "Delete", "object": "exists"}',
                 content_type="application/json",
+                HTTP_SIGNATURE=SIGNATURE,
             )
-            self.assertEqual(result.status_code, 200)
+            self.assertEqual(result.status_code, 202)
 
     def test_inbox_unknown_type(self):
         """never heard of that activity type, don't have a handler for it"""
@@ -95,6 +185,7 @@ class Inbox(TestCase):
                 "/inbox",
                 '{"type": "Fish", "object": "exists"}',
                 content_type="application/json",
+                HTTP_SIGNATURE=SIGNATURE,
             )
             mock_valid.return_value = True
             self.assertIsInstance(result, HttpResponseNotFound)
@@ -116,14 +207,18 @@ class Inbox(TestCase):
             "curation": "curated",
             "@context": "https://www.w3.org/ns/activitystreams",
         }
+        activity["actor"] = self.remote_user.remote_id
         with patch("bookwyrm.views.inbox.has_valid_signature") as mock_valid:
             mock_valid.return_value = True
 
             with patch("bookwyrm.views.inbox.activity_task.delay"):
                 result = self.client.post(
-                    "/inbox", json.dumps(activity), content_type="application/json"
+                    "/inbox",
+                    json.dumps(activity),
+                    content_type="application/json",
+                    HTTP_SIGNATURE=SIGNATURE,
                 )
-        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.status_code, 202)
 
     def test_is_blocked_user_agent(self):
         """check for blocked servers"""
@@ -139,16 +234,16 @@ class Inbox(TestCase):
         with self.assertRaises(PermissionDenied):
             views.inbox.raise_is_blocked_user_agent(request)
 
-    def test_is_blocked_activity(self):
+    def test_is_blocked_actor(self):
         """check for blocked servers"""
-        activity = {"actor": "https://mastodon.social/user/whaatever/else"}
-        self.assertIsNone(views.inbox.raise_is_blocked_activity(activity))
+        actor = "https://mastodon.social/user/whaatever/else"
+        self.assertIsNone(views.inbox.raise_is_blocked_actor(actor))
 
         models.FederatedServer.objects.create(
             server_name="mastodon.social", status="blocked"
         )
         with self.assertRaises(PermissionDenied):
-            views.inbox.raise_is_blocked_activity(activity)
+            views.inbox.raise_is_blocked_actor(actor)
 
     @patch("bookwyrm.suggested_users.remove_user_task.delay")
     def test_create_by_deactivated_user(self, _):
@@ -166,5 +261,6 @@ class Inbox(TestCase):
             "/inbox",
             json.dumps(activity),
             content_type="application/json",
+            HTTP_SIGNATURE=SIGNATURE,
         )
         self.assertEqual(response.status_code, 403)
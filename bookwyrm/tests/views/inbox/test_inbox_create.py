@@ -3,7 +3,8 @@ import json
 import pathlib
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
 
 from bookwyrm import models, views
 from bookwyrm.activitypub import ActivitySerializerError
@@ -255,3 +256,57 @@ class InboxCreate(TestCase):
         }
         with self.assertRaises(ActivitySerializerError):
             views.inbox.activity_task(activity)
+
+
+@patch("bookwyrm.models.activitypub_mixin.broadcast_task.apply_async")
+@patch("bookwyrm.activitystreams.add_status_task.delay")
+@patch("bookwyrm.activitystreams.add_book_statuses_task.delay")
+class InboxCreateCommit(TransactionTestCase):
+    """related objects are loaded by tasks that need committed data"""
+
+    def setUp(self):
+        """a remote user to post the status"""
+        with patch("bookwyrm.models.user.set_remote_server.delay"):
+            self.remote_user = models.User.objects.create_user(
+                "rat",
+                "rat@rat.com",
+                "ratword",
+                local=False,
+                remote_id="https://example.com/users/rat",
+                inbox="https://example.com/users/rat/inbox",
+                outbox="https://example.com/users/rat/outbox",
+            )
+        models.SiteSettings.objects.create()
+
+    def test_create_status_attachment_after_commit(self, *_):
+        """set_related_field is only queued once the status is committed"""
+        datafile = pathlib.Path(__file__).parent.joinpath("../../data/ap_note.json")
+        status_data = json.loads(datafile.read_bytes())
+        status_data["tag"] = []
+        status_data["attachment"] = [
+            {
+                "type": "Document",
+                "url": "https://example.com/images/cover.jpg",
+                "name": "alt text",
+            }
+        ]
+        activity = {
+            "id": "hi",
+            "type": "Create",
+            "actor": "https://example.com/users/rat",
+            "to": ["https://www.w3.org/ns/activitystreams#public"],
+            "cc": [],
+            "object": status_data,
+        }
+
+        in_transaction = []
+        with patch(
+            "bookwyrm.activitypub.base_activity.set_related_field.delay"
+        ) as mock_task:
+            mock_task.side_effect = lambda *_: in_transaction.append(
+                connection.in_atomic_block
+            )
+            views.inbox.activity_task(activity)
+
+        self.assertEqual(in_transaction, [False])
+        self.assertEqual(mock_task.call_args[0][3], status_data["id"])
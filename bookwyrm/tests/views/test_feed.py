@@ -132,6 +132,27 @@ class FeedViews(TestCase):
             with self.assertRaises(Http404):
                 view(request, "mouse", status.id)
 
+    def test_status_page_not_found_blocked(self, *_):
+        """can't see statuses by users who have blocked you"""
+        view = views.Status.as_view()
+        another_user = models.User.objects.create_user(
+            "rat@local.com",
+            "rat@rat.rat",
+            "password",
+            local=True,
+            localname="rat",
+        )
+        another_user.blocks.add(self.local_user)
+        with patch("bookwyrm.models.activitypub_mixin.broadcast_task.apply_async"):
+            status = models.Status.objects.create(content="hi", user=another_user)
+
+        request = self.factory.get("")
+        request.user = self.local_user
+        with patch("bookwyrm.views.feed.is_api_request") as is_api:
+            is_api.return_value = False
+            with self.assertRaises(Http404):
+                view(request, "rat", status.id)
+
     def test_status_page_with_image(self, *_):
         """there are so many views, this just makes sure it LOADS"""
         view = views.Status.as_view()
@@ -1,6 +1,6 @@
 """ test for app action functionality """
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pathlib
 from django.http import Http404
 from django.test import TestCase
@@ -112,6 +112,31 @@ class ViewsHelpers(TestCase):
         request = self.factory.get("", {"q": "Test Book"}, HTTP_USER_AGENT=USER_AGENT)
         self.assertTrue(views.helpers.is_bookwyrm_request(request))
 
+    def test_conditional_activitypub_response(self, *_):
+        """serve a 304 when the client has the current version"""
+        request = self.factory.get("/user/mouse")
+        result = views.helpers.conditional_activitypub_response(
+            request, (1, "v1"), lambda: {"id": "hi"}
+        )
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(json.loads(result.content), {"id": "hi"})
+        etag = result["ETag"]
+
+        request = self.factory.get("/user/mouse", HTTP_IF_NONE_MATCH=etag)
+        get_activity = MagicMock()
+        result = views.helpers.conditional_activitypub_response(
+            request, (1, "v1"), get_activity
+        )
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result["ETag"], etag)
+        self.assertFalse(get_activity.called)
+
+        result = views.helpers.conditional_activitypub_response(
+            request, (1, "v2"), lambda: {"id": "hi"}
+        )
+        self.assertEqual(result.status_code, 200)
+        self.assertNotEqual(result["ETag"], etag)
+
     def test_handle_remote_webfinger_invalid(self, *_):
         """Various ways you can send a bad query"""
         # if there's no query, there's no result
@@ -80,6 +80,52 @@ class UserViews(TestCase):
         self.assertIsInstance(result, ActivitypubResponse)
         self.assertEqual(result.status_code, 200)
 
+    def test_user_page_not_modified(self):
+        """peers that already have the actor get a 304"""
+        view = views.User.as_view()
+        request = self.factory.get("")
+        request.user = self.anonymous_user
+        with patch("bookwyrm.views.user.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse")
+        self.assertEqual(result.status_code, 200)
+        etag = result["ETag"]
+
+        request = self.factory.get("", HTTP_IF_NONE_MATCH=etag)
+        request.user = self.anonymous_user
+        with patch("bookwyrm.views.user.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse")
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result["ETag"], etag)
+
+        # a new key means a new version of the actor
+        self.local_user.key_pair.save()
+        with patch("bookwyrm.views.user.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse")
+        self.assertEqual(result.status_code, 200)
+        self.assertNotEqual(result["ETag"], etag)
+
+    def test_user_page_cache_key(self):
+        """a new version of the actor is cached under a new key"""
+        view = views.User.as_view()
+        request = self.factory.get("")
+        request.user = self.anonymous_user
+        with patch("bookwyrm.views.user.is_api_request") as is_api, patch(
+            "bookwyrm.views.user.cache.get_or_set"
+        ) as cache_mock:
+            is_api.return_value = True
+            cache_mock.return_value = self.local_user.to_activity()
+            view(request, "mouse")
+            self.local_user.key_pair.save()
+            view(request, "mouse")
+        self.assertEqual(cache_mock.call_count, 2)
+        first_key = cache_mock.call_args_list[0][0][0]
+        second_key = cache_mock.call_args_list[1][0][0]
+        self.assertTrue(first_key.startswith(f"user-activity-{self.local_user.id}-"))
+        self.assertNotEqual(first_key, second_key)
+
     def test_user_page_domain(self):
         """when the user domain has dashes in it"""
         with patch("bookwyrm.models.user.set_remote_server"):
@@ -139,6 +185,36 @@ class UserViews(TestCase):
         self.assertIsInstance(result, ActivitypubResponse)
         self.assertEqual(result.status_code, 200)
 
+    @patch("bookwyrm.suggested_users.rerank_suggestions_task.delay")
+    @patch("bookwyrm.suggested_users.rerank_user_task.delay")
+    @patch("bookwyrm.activitystreams.populate_stream_task.delay")
+    @patch("bookwyrm.lists_stream.populate_lists_task.delay")
+    def test_followers_page_ap_not_modified(self, *_):
+        """the collection is a new version when its owner changes"""
+        view = views.Relationships.as_view()
+        request = self.factory.get("")
+        request.user = self.anonymous_user
+        with patch("bookwyrm.views.relationships.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse", "followers")
+        self.assertEqual(result.status_code, 200)
+        etag = result["ETag"]
+
+        request = self.factory.get("", HTTP_IF_NONE_MATCH=etag)
+        request.user = self.anonymous_user
+        with patch("bookwyrm.views.relationships.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse", "followers")
+        self.assertEqual(result.status_code, 304)
+
+        self.local_user.name = "Mouse McMouse"
+        self.local_user.save(broadcast=False)
+        with patch("bookwyrm.views.relationships.is_api_request") as is_api:
+            is_api.return_value = True
+            result = view(request, "mouse", "followers")
+        self.assertEqual(result.status_code, 200)
+        self.assertNotEqual(result["ETag"], etag)
+
     def test_followers_page_anonymous(self):
         """there are so many views, this just makes sure it LOADS"""
         view = views.Relationships.as_view()
@@ -117,10 +117,14 @@ class Status(View):
     # pylint: disable=unused-argument
     def get(self, request, username, status_id, slug=None):
         """display a particular status (and replies, etc)"""
-        user = get_user_from_username(request.user, username)
+        # look up the status and its author in one query
+        queryset = models.Status.objects.select_subclasses().select_related("user")
+        if request.user.is_authenticated:
+            queryset = queryset.exclude(user__blocks=request.user)
         status = get_object_or_404(
-            models.Status.objects.select_subclasses(),
-            user=user,
+            queryset,
+            Q(user__localname=username) | Q(user__username=username),
+            user__is_active=True,
             id=status_id,
             deleted=False,
         )
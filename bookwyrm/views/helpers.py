@@ -1,4 +1,5 @@
 """ helper functions used in various views """
+import hashlib
 import re
 from datetime import datetime, timedelta
 import dateutil.parser
@@ -11,6 +12,8 @@ from django.conf import settings as django_settings
 from django.shortcuts import redirect
 from django.http import Http404
 from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 
 from bookwyrm import activitypub, models, settings
 from bookwyrm.connectors import ConnectorException, get_data
@@ -51,6 +54,32 @@ def is_api_request(request):
     )
 
 
+def get_actor_version(user):
+    """values that change whenever the user's actor document does"""
+    return (
+        user.id,
+        user.updated_date,
+        user.is_active,
+        user.key_pair.updated_date if user.key_pair else None,
+    )
+
+
+def get_version_hash(version):
+    """a short digest of a tuple of version values"""
+    return hashlib.md5(repr(version).encode("utf-8")).hexdigest()
+
+
+def conditional_activitypub_response(request, version, get_activity):
+    """serve a 304 if the client already has this version of the activity,
+    where version is a tuple of values that change whenever the activity does"""
+    etag = quote_etag(get_version_hash((request.get_full_path(), *version)))
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = activitypub.ActivitypubResponse(get_activity())
+    response["ETag"] = etag
+    return response
+
+
 def is_bookwyrm_request(request):
     """check if the request is coming from another bookwyrm instance"""
     user_agent = request.headers.get("User-Agent")
@@ -1,25 +1,32 @@
 """ incoming activities """
-import json
 import re
 import logging
 
 from urllib.parse import urldefrag
+import orjson
 import requests
 
 from django.http import HttpResponse, Http404
+from django.core.cache import cache
 from django.core.exceptions import BadRequest, PermissionDenied
-from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
 from bookwyrm import activitypub, models
+from bookwyrm.connectors import ConnectorException, get_data
 from bookwyrm.tasks import app
 from bookwyrm.signatures import Signature
 from bookwyrm.utils import regex
 
 logger = logging.getLogger(__name__)
 
+# how long to remember that a signing actor doesn't exist
+UNRESOLVABLE_ACTOR_TIMEOUT = 60 * 5
+
+# a cheap check for deletes when the body hasn't been parsed
+DELETE_ACTIVITY = re.compile(rb'"type"\s*:\s*"Delete"')
+
 
 @method_decorator(csrf_exempt, name="dispatch")
 # pylint: disable=no-self-use
@@ -32,17 +39,39 @@ class Inbox(View):
         raise_is_blocked_user_agent(request)
 
         # make sure the user's inbox even exists
-        if username:
-            get_object_or_404(models.User, localname=username, is_active=True)
+        if (
+            username
+            and not models.User.objects.filter(
+                localname=username, is_active=True
+            ).exists()
+        ):
+            raise Http404()
 
-        # is it valid json? does it at least vaguely resemble an activity?
+        # authenticate the request before doing any work on the body
         try:
-            activity_json = json.loads(request.body)
-        except json.decoder.JSONDecodeError:
-            raise BadRequest()
+            signature = Signature.parse(request)
+        except (KeyError, ValueError):
+            return HttpResponse(status=401)
+        key_actor = urldefrag(signature.key_id).url
 
         # let's be extra sure we didn't block this domain
-        raise_is_blocked_activity(activity_json)
+        raise_is_blocked_actor(key_actor)
+
+        if not has_valid_signature(request, signature):
+            if DELETE_ACTIVITY.search(request.body):
+                # Pretend that unauth'd deletes succeed. Auth may be failing
+                # because the resource or owner of the resource might have
+                # been deleted.
+                return HttpResponse(status=202)
+            return HttpResponse(status=401)
+
+        # is it valid json? does it at least vaguely resemble an activity?
+        # this reads request.body rather than streaming from the request,
+        # since the raw body is needed again to check the signed digest
+        try:
+            activity_json = orjson.loads(request.body)
+        except orjson.JSONDecodeError:
+            raise BadRequest()
 
         if (
             not "object" in activity_json
@@ -51,17 +80,14 @@ class Inbox(View):
         ):
             raise Http404()
 
-        # verify the signature
-        if not has_valid_signature(request, activity_json):
-            if activity_json["type"] == "Delete":
-                # Pretend that unauth'd deletes succeed. Auth may be failing
-                # because the resource or owner of the resource might have
-                # been deleted.
-                return HttpResponse()
+        # the signature is only good for activities by the actor who signed it
+        if activity_json.get("actor") != key_actor:
             return HttpResponse(status=401)
 
+        # the activity is handled in the background, so it's accepted for
+        # processing rather than done
         activity_task.delay(activity_json)
-        return HttpResponse()
+        return HttpResponse(status=202)
 
 
 def raise_is_blocked_user_agent(request):
@@ -79,17 +105,10 @@ def raise_is_blocked_user_agent(request):
         raise PermissionDenied()
 
 
-def raise_is_blocked_activity(activity_json):
-    """get the sender out of activity json and check if it's blocked"""
-    actor = activity_json.get("actor")
-
-    if not actor:
-        # well I guess it's not even a valid activity so who knows
-        return
-
-    # check if the user is banned/deleted
-    existing = models.User.find_existing_by_remote_id(actor)
-    if existing and existing.deleted:
+def raise_is_blocked_actor(actor):
+    """check if the actor sending an activity is blocked"""
+    # check if the user is banned/deleted, without loading the whole user
+    if models.User.objects.filter(remote_id=actor, is_active=False).exists():
         logger.debug("%s is banned/deleted, denying request based on actor", actor)
         raise PermissionDenied()
 
@@ -109,16 +128,35 @@ def activity_task(activity_json):
     activity.action()
 
 
-def has_valid_signature(request, activity):
-    """verify incoming signature"""
+def get_signing_actor(key_actor):
+    """the user who signed a request, loaded from their server if they're new"""
+    remote_user = models.User.find_existing_by_remote_id(key_actor)
+    if remote_user:
+        return remote_user
+
+    # don't keep hammering actors that we know are gone
+    cache_key = f"unresolvable-actor-{key_actor}"
+    if cache.get(cache_key):
+        return None
+
     try:
-        signature = Signature.parse(request)
+        data = get_data(key_actor)
+    except ConnectorException as err:
+        # timeouts and server errors may pass, so only remember missing actors
+        if err.response is not None and err.response.status_code in (404, 410):
+            cache.set(cache_key, True, timeout=UNRESOLVABLE_ACTOR_TIMEOUT)
+        return None
+
+    remote_user = models.User.find_existing(data)
+    if remote_user:
+        return remote_user
+    return models.User.activity_serializer(**data).to_model(model=models.User)
 
-        key_actor = urldefrag(signature.key_id).url
-        if key_actor != activity.get("actor"):
-            raise ValueError("Wrong actor created signature.")
 
-        remote_user = activitypub.resolve_remote_id(key_actor, model=models.User)
+def has_valid_signature(request, signature):
+    """verify incoming signature with the key of the actor who signed it"""
+    try:
+        remote_user = get_signing_actor(urldefrag(signature.key_id).url)
         if not remote_user:
             return False
 
@@ -1,13 +1,18 @@
 """ Following and followers lists """
 from django.core.exceptions import PermissionDenied
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Max
 from django.template.response import TemplateResponse
 from django.views import View
 
-from bookwyrm.activitypub import ActivitypubResponse
+from bookwyrm import models
 from bookwyrm.settings import PAGE_LENGTH
-from .helpers import get_user_from_username, is_api_request
+from .helpers import (
+    conditional_activitypub_response,
+    get_actor_version,
+    get_user_from_username,
+    is_api_request,
+)
 
 
 # pylint: disable=no-self-use
@@ -20,8 +25,24 @@ class Relationships(View):
 
         if is_api_request(request):
             if direction == "followers":
-                return ActivitypubResponse(user.to_followers_activity(**request.GET))
-            return ActivitypubResponse(user.to_following_activity(**request.GET))
+                follows = models.UserFollows.objects.filter(user_object=user)
+                user_field = "user_subject"
+                get_activity = user.to_followers_activity
+            else:
+                follows = models.UserFollows.objects.filter(user_subject=user)
+                user_field = "user_object"
+                get_activity = user.to_following_activity
+            # the collection changes when a follow is added or removed, or
+            # when a listed user is updated, and the collection root embeds
+            # the owner's actor
+            version = follows.aggregate(
+                Count("id"), Max("created_date"), Max(f"{user_field}__updated_date")
+            )
+            return conditional_activitypub_response(
+                request,
+                (*get_actor_version(user), direction, *version.values()),
+                lambda: get_activity(**request.GET),
+            )
 
         if user.hide_follows and user != request.user:
             raise PermissionDenied()
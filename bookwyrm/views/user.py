@@ -9,9 +9,15 @@ from django.views import View
 from django.views.decorators.http import require_POST
 
 from bookwyrm import models
-from bookwyrm.activitypub import ActivitypubResponse
 from bookwyrm.settings import PAGE_LENGTH
-from .helpers import get_user_from_username, is_api_request
+from bookwyrm.utils import cache
+from .helpers import (
+    conditional_activitypub_response,
+    get_actor_version,
+    get_user_from_username,
+    get_version_hash,
+    is_api_request,
+)
 
 
 # pylint: disable=no-self-use
@@ -24,7 +30,16 @@ class User(View):
 
         if is_api_request(request):
             # we have a json request
-            return ActivitypubResponse(user.to_activity())
+            version = get_actor_version(user)
+            return conditional_activitypub_response(
+                request,
+                version,
+                lambda: cache.get_or_set(
+                    f"user-activity-{user.id}-{get_version_hash(version)}",
+                    user.to_activity,
+                    timeout=60 * 60,
+                ),
+            )
         # otherwise we're at a UI view
 
         shelf_preview = []